@@ -82,20 +82,23 @@ def followup_agent(assessment_text, action_plan_text):
 
 # -------- PARALLEL EXECUTION --------
 def run_agents_parallel(background, concerns, goals, coping_mechanisms,
-                        sleep_quality, physical_activity, social_support):
+                        sleep_quality, physical_activity, social_support,
+                        assessment_text=None):
 
     results = {"assessment": "", "action": "", "follow": ""}
 
     with ThreadPoolExecutor(max_workers=3) as executor:
 
-        future_assessment = executor.submit(
-            assessment_agent,
-            background, concerns, goals, coping_mechanisms,
-            sleep_quality, physical_activity, social_support
-        )
+        # Skip the assessment when a speculative one is passed in
+        if assessment_text is None:
+            future_assessment = executor.submit(
+                assessment_agent,
+                background, concerns, goals, coping_mechanisms,
+                sleep_quality, physical_activity, social_support
+            )
 
-        # Wait for assessment to finish first
-        assessment_text = future_assessment.result()
+            # Wait for assessment to finish first
+            assessment_text = future_assessment.result()
         results["assessment"] = assessment_text
 
         futures = {
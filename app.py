@@ -5,11 +5,13 @@ from textwrap import dedent
 
 # Agents + UI Modules
 from agents import run_agents_parallel
+from speculation import AssessmentSpeculator, speculation_enabled
 from tools_ui import journal_ui, relaxation_ui, recommendations_ui, safety_ui
 
 # Storage + Sentiment
 from storage import load_json, save_json
 from sentiment import sentiment_score
+from profiling import start_rerun, finish_rerun, section
 
 # Load environment variables
 load_dotenv()
@@ -21,20 +23,24 @@ st.set_page_config(
     layout="wide"
 )
 
+start_rerun()
+
 # ---------------- CSS LOADER ----------------
 def load_local_css(file_name):
     file_path = os.path.join(os.path.dirname(__file__), file_name)
     with open(file_path, "r", encoding="utf-8") as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
-load_local_css("styles.css")
+with section("css"):
+    load_local_css("styles.css")
 
 # ---------------- SIDEBAR ----------------
-st.sidebar.title("MindMesh Tools")
-tool = st.sidebar.radio(
-    "Choose a section:",
-    ["Main Assistant", "Journal", "Relaxation", "Recommendations", "Safety"]
-)
+with section("sidebar"):
+    st.sidebar.title("MindMesh Tools")
+    tool = st.sidebar.radio(
+        "Choose a section:",
+        ["Main Assistant", "Journal", "Relaxation", "Recommendations", "Safety"]
+    )
 
 #                           MAIN ASSISTANT
 if tool == "Main Assistant":
@@ -89,9 +95,24 @@ if tool == "Main Assistant":
         st.markdown("<div class='section-title'>Social Support</div>", unsafe_allow_html=True)
         social_support = st.radio(" ", ["Strong", "Somewhat strong", "Weak", "No support"])
 
+    assessment_inputs = (
+        background, concerns, goals, coping_mechanisms,
+        sleep_quality, physical_activity, social_support
+    )
+
     # ---------------- GENERATE BUTTON ----------------
     generate = st.button("✨ Generate Plan")
 
+    # ---------------- SPECULATIVE ASSESSMENT ----------------
+    # Start the assessment early once the form is filled and has settled;
+    # a click reuses it only if the inputs haven't changed since.
+    speculate = speculation_enabled()
+    if speculate:
+        if "speculator" not in st.session_state:
+            st.session_state.speculator = AssessmentSpeculator()
+        if not generate:
+            st.session_state.speculator.update(assessment_inputs)
+
     for key in ["assessment", "action", "follow"]:
         if key not in st.session_state:
             st.session_state[key] = ""
@@ -100,10 +121,13 @@ if tool == "Main Assistant":
         if not (background.strip() and concerns.strip() and goals.strip()):
             st.error("Please fill all fields.")
         else:
-            with st.spinner("Generating Plan..."):
+            with st.spinner("Generating Plan..."), section("assistant.agents"):
+                assessment_text = None
+                if speculate:
+                    assessment_text = st.session_state.speculator.take(assessment_inputs)
+
                 results = run_agents_parallel(
-                    background, concerns, goals, coping_mechanisms,
-                    sleep_quality, physical_activity, social_support
+                    *assessment_inputs, assessment_text=assessment_text
                 )
 
                 st.session_state.assessment = results["assessment"]
@@ -113,39 +137,55 @@ if tool == "Main Assistant":
             st.success("Done!")
 
     # ---------------- RESULTS ----------------
-    st.markdown('<div class="glass" style="margin-top:20px">', unsafe_allow_html=True)
-    st.subheader("Results")
+    with section("assistant.results"):
+        st.markdown('<div class="glass" style="margin-top:20px">', unsafe_allow_html=True)
+        st.subheader("Results")
+
+        st.markdown("### 📝 Assessment")
+        st.markdown(st.session_state.assessment or "No assessment yet.")
 
-    st.markdown("### 📝 Assessment")
-    st.markdown(st.session_state.assessment or "No assessment yet.")
+        st.markdown("### ✅ Action Plan")
+        st.markdown(st.session_state.action or "")
 
-    st.markdown("### ✅ Action Plan")
-    st.markdown(st.session_state.action or "")
+        st.markdown("### 💬 Follow-Up")
+        st.markdown(st.session_state.follow or "")
 
-    st.markdown("### 💬 Follow-Up")
-    st.markdown(st.session_state.follow or "")
+        st.markdown('</div>', unsafe_allow_html=True)
 
-    st.markdown('</div>', unsafe_allow_html=True)
+    if speculate:
+        m = st.session_state.speculator.metrics()
+        st.caption(
+            f"Speculation: {m['hits']} hits / {m['misses']} misses "
+            f"({m['hit_rate']:.0%}), {m['launched']} started, {m['stale']} stale, "
+            f"~{m['saved_seconds']}s saved"
+        )
 
 
 #OTHER SECTIONS
 
 elif tool == "Journal":
-    journal_ui()
+    with section("journal"):
+        journal_ui()
 
 elif tool == "Relaxation":
-    relaxation_ui()
+    with section("relaxation"):
+        relaxation_ui()
 
 elif tool == "Recommendations":
-    recommendations_ui()
+    with section("recommendations"):
+        recommendations_ui()
 
 elif tool == "Safety":
-    safety_ui()
+    with section("safety"):
+        safety_ui()
 
 # ---------------- FOOTER ----------------
-st.markdown(
-    """
-    <div class='footer'>MindMesh • Built with care</div>
-    """,
-    unsafe_allow_html=True
-)
+with section("footer"):
+    st.markdown(
+        """
+        <div class='footer'>MindMesh • Built with care</div>
+        """,
+        unsafe_allow_html=True
+    )
+
+finish_rerun(page=tool)
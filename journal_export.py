@@ -0,0 +1,284 @@
+# journal_export.py
+"""Export data/journal.json to columnar part files for offline analytics.
+
+Each run streams only the entries added since the last export (tracked by a
+watermark file in the output directory) and writes them to one new part file:
+Parquet or Arrow IPC when pyarrow is installed, CSV otherwise. All parts in a
+directory share one format; switching formats needs --full.
+
+Usage: python journal_export.py [--out data/exports/journal]
+                                [--format parquet|arrow|csv] [--include-text]
+                                [--chunk-size 10000] [--full]
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import warnings
+from datetime import datetime
+from itertools import islice
+
+from storage import DATA_DIR, iter_json
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+JOURNAL_FILE = "journal.json"
+DEFAULT_OUT_DIR = os.path.join(DATA_DIR, "exports", "journal")
+WATERMARK_FILE = "_watermark.json"
+# As written by tools_ui.journal_ui.
+TIMESTAMP_FORMAT = "%d %b %Y, %I:%M %p"
+EXTENSIONS = {"parquet": "parquet", "arrow": "arrow", "csv": "csv"}
+
+
+# -------- WATERMARK --------
+def fingerprint(entry):
+    """Hash of one journal entry, to check the journal wasn't rewritten."""
+    payload = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_watermark(out_dir):
+    """Export state of out_dir: {"exported": n, "format": ..., "last": ...}."""
+    try:
+        with open(os.path.join(out_dir, WATERMARK_FILE), "r", encoding="utf-8") as f:
+            mark = json.load(f)
+        return {
+            "exported": int(mark.get("exported", 0)),
+            "format": mark.get("format"),
+            "last": mark.get("last"),
+        }
+    except (OSError, ValueError, AttributeError):
+        return {"exported": 0, "format": None, "last": None}
+
+
+def save_watermark(out_dir, exported, fmt, last):
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({
+            "exported": exported,
+            "format": fmt,
+            "last": last,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }, f)
+    os.replace(path + ".tmp", path)
+
+
+def _remove_parts(out_dir, keep=None):
+    for name in os.listdir(out_dir):
+        path = os.path.join(out_dir, name)
+        if name.startswith("journal-") and path != keep:
+            os.remove(path)
+
+
+# -------- ROWS --------
+def _parse_timestamp(value):
+    try:
+        return datetime.strptime(value, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _polarity(entry):
+    if entry.get("polarity") is not None:
+        return float(entry["polarity"])
+    # Entries saved before polarity was stored.
+    from sentiment import polarity_score
+    return polarity_score(entry.get("text", ""))
+
+
+def to_columns(entries, first_index, include_text=False):
+    """Turn a chunk of journal entries into a dict of column lists."""
+    columns = {
+        "entry": [],
+        "timestamp": [],
+        "sentiment": [],
+        "polarity": [],
+        "text_length": [],
+    }
+    if include_text:
+        columns["text"] = []
+
+    for offset, entry in enumerate(entries):
+        text = entry.get("text", "")
+        columns["entry"].append(first_index + offset)
+        columns["timestamp"].append(_parse_timestamp(entry.get("timestamp")))
+        columns["sentiment"].append(entry.get("sentiment"))
+        columns["polarity"].append(_polarity(entry))
+        columns["text_length"].append(len(text))
+        if include_text:
+            columns["text"].append(text)
+    return columns
+
+
+def _schema(include_text):
+    fields = [
+        ("entry", pa.int64()),
+        ("timestamp", pa.timestamp("s")),
+        ("sentiment", pa.string()),
+        ("polarity", pa.float64()),
+        ("text_length", pa.int32()),
+    ]
+    if include_text:
+        fields.append(("text", pa.string()))
+    return pa.schema(fields)
+
+
+# -------- WRITERS --------
+class _ParquetWriter:
+    def __init__(self, path, include_text):
+        self.schema = _schema(include_text)
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, columns):
+        self.writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path, include_text):
+        self.schema = _schema(include_text)
+        self.sink = pa.OSFile(path, "wb")
+        self.writer = pa.ipc.new_file(self.sink, self.schema)
+
+    def write(self, columns):
+        self.writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+        self.sink.close()
+
+
+class _CSVWriter:
+    def __init__(self, path, include_text):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = None
+
+    def write(self, columns):
+        names = list(columns)
+        if self.writer is None:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(names)
+        for row in zip(*columns.values()):
+            self.writer.writerow(
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            )
+
+    def close(self):
+        self.file.close()
+
+
+WRITERS = {"parquet": _ParquetWriter, "arrow": _ArrowWriter, "csv": _CSVWriter}
+
+
+# -------- EXPORT --------
+def export_journal(out_dir=DEFAULT_OUT_DIR, fmt="parquet", include_text=False,
+                   chunk_size=10_000, full=False):
+    """Export entries past the watermark to a new part file in out_dir.
+
+    Returns (path, rows). path is None when there was nothing new.
+    Falls back to CSV when pyarrow isn't installed. If the journal no longer
+    matches the watermark (it shrank or was rewritten), warns and re-exports
+    everything.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if pa is None:
+        fmt = "csv"
+
+    os.makedirs(out_dir, exist_ok=True)
+    mark = load_watermark(out_dir)
+    if not full and mark["exported"] and mark["format"] not in (None, fmt):
+        raise ValueError(
+            f"{out_dir} already holds {mark['format']} parts; "
+            f"use --full to re-export as {fmt}"
+        )
+
+    stream = iter_json(JOURNAL_FILE)
+    start = 0 if full else mark["exported"]
+    if start:
+        seen, last = 0, None
+        for last in islice(stream, start):
+            seen += 1
+        if seen < start or (mark["last"] and fingerprint(last) != mark["last"]):
+            warnings.warn(
+                f"{JOURNAL_FILE} has changed since the last export "
+                f"({seen} entries checked, {start} exported before); re-exporting everything."
+            )
+            full, start = True, 0
+            stream = iter_json(JOURNAL_FILE)
+
+    tmp_path = os.path.join(out_dir, f"_in_progress.{EXTENSIONS[fmt]}")
+    writer = None
+    rows = 0
+    last = None
+    try:
+        while True:
+            chunk = list(islice(stream, chunk_size))
+            if not chunk:
+                break
+            if writer is None:
+                writer = WRITERS[fmt](tmp_path, include_text)
+            writer.write(to_columns(chunk, start + rows, include_text))
+            rows += len(chunk)
+            last = chunk[-1]
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            os.remove(tmp_path)
+        raise
+    if writer is not None:
+        writer.close()
+
+    if not rows:
+        if full:
+            # Nothing left in the journal: clear the old parts too.
+            _remove_parts(out_dir)
+            save_watermark(out_dir, 0, fmt, None)
+        return None, 0
+
+    path = os.path.join(out_dir, f"journal-{start:08d}-{start + rows:08d}.{EXTENSIONS[fmt]}")
+    os.replace(tmp_path, path)
+    if full:
+        # A full export replaces the earlier incremental parts.
+        _remove_parts(out_dir, keep=path)
+    save_watermark(out_dir, start + rows, fmt, fingerprint(last))
+    return path, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar export of the journal")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--format", choices=list(WRITERS), default="parquet")
+    parser.add_argument("--include-text", action="store_true",
+                        help="also export the entry text")
+    parser.add_argument("--chunk-size", type=int, default=10_000,
+                        help="entries held in memory at a time")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the watermark and re-export every entry")
+    args = parser.parse_args()
+
+    if pa is None and args.format != "csv":
+        print("pyarrow is not installed; exporting CSV instead.")
+
+    try:
+        path, rows = export_journal(args.out, args.format, args.include_text,
+                                    args.chunk_size, args.full)
+    except ValueError as e:
+        parser.exit(1, f"Export failed: {e}\n")
+    if path:
+        print(f"Exported {rows} entries to {path}")
+    else:
+        print("No new entries to export.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+# loadtest.py
+"""Drive many simulated sessions through app.py with Streamlit's AppTest.
+
+All sessions share this process (like one `streamlit run app.py`) and talk to a
+local stub of the OpenAI chat endpoint, so no API key or network is needed.
+
+Usage: python loadtest.py [--levels 1,2,4,8] [--iterations 2]
+                          [--flows plan,journal,breathing,support]
+                          [--llm-latency 0.5] [--json results.json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, "app.py")
+FLOWS = ["plan", "journal", "breathing", "support"]
+
+
+# -------- STUB LLM --------
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency)
+        body = json.dumps({
+            "id": "stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Stub reply."},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_llm(latency):
+    _StubLLMHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# -------- FLOWS --------
+class HarnessError(Exception):
+    """AppTest returned an empty element tree: a harness glitch, not an app error."""
+
+
+def _find(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No widget labelled {label!r}")
+
+
+def _rendered(at):
+    # Every page draws the sidebar radio and at least the footer markdown.
+    return len(at.sidebar.radio) > 0 and len(at.main.markdown) > 0
+
+
+def _run(at):
+    at.run()
+    if not at.exception and not _rendered(at):
+        # Concurrent AppTests in one process sometimes come back empty.
+        at.run()
+        if not at.exception and not _rendered(at):
+            raise HarnessError("AppTest returned an empty element tree")
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def _open(at, page):
+    at.sidebar.radio[0].set_value(page)
+    _run(at)
+
+
+def flow_plan(at, tag):
+    _open(at, "Main Assistant")
+    _find(at.text_area, "Background").input(f"Background {tag}")
+    _find(at.text_area, "Concerns").input("Feeling stretched thin")
+    _find(at.text_area, "Goals").input("Sleep better")
+    _find(at.button, "✨ Generate Plan").click()
+    _run(at)
+    if not at.session_state["assessment"]:
+        raise RuntimeError("No assessment generated")
+
+
+def flow_journal(at, tag):
+    _open(at, "Journal")
+    _find(at.text_area, "Write freely...").input(tag)
+    _find(at.button, "Save Entry").click()
+    _run(at)
+
+
+def flow_breathing(at, tag):
+    _open(at, "Relaxation")
+    _find(at.button, "Start Breathing Exercise").click()
+    _run(at)
+
+
+def flow_support(at, tag):
+    _open(at, "Safety")
+    _find(at.text_area, "Write anything you want. This stays confidential:").input(
+        f"Rough day {tag}"
+    )
+    _find(at.button, "Get AI Support").click()
+    _run(at)
+
+
+FLOW_FUNCS = {
+    "plan": flow_plan,
+    "journal": flow_journal,
+    "breathing": flow_breathing,
+    "support": flow_support,
+}
+
+
+# -------- RESOURCE SAMPLING --------
+def _rss_mb():
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    # ru_maxrss is the peak, in KB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _Sampler:
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.max_threads = 0
+        self.max_rss_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.max_threads = max(self.max_threads, threading.active_count())
+            self.max_rss_mb = max(self.max_rss_mb, _rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+# -------- RUNNER --------
+def percentile(values, pct):
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _record_error(out, label, error):
+    kind = "harness_errors" if isinstance(error, HarnessError) else "errors"
+    out[kind].append(f"{label}: {error}")
+
+
+def _new_session(app_test_cls, timeout):
+    at = app_test_cls.from_file(APP_PATH, default_timeout=timeout)
+    _run(at)
+    return at
+
+
+def _session(app_test_cls, index, level, flows, iterations, timeout, out):
+    try:
+        at = _new_session(app_test_cls, timeout)
+    except Exception as e:
+        _record_error(out, f"session {index}: startup", e)
+        return
+
+    for i in range(iterations):
+        for name in flows:
+            tag = f"loadtest-{level}-{index}-{i}-{name}"
+            start = time.perf_counter()
+            try:
+                FLOW_FUNCS[name](at, tag)
+            except Exception as e:
+                _record_error(out, tag, e)
+                # Start the next flow from a fresh session rather than a broken tree.
+                try:
+                    at = _new_session(app_test_cls, timeout)
+                except Exception as e:
+                    _record_error(out, f"session {index}: restart", e)
+                    return
+                continue
+            out["latencies"].setdefault(name, []).append(time.perf_counter() - start)
+            if name == "journal":
+                out["journal_tags"].append(tag)
+
+
+def _journal_texts():
+    from storage import load_json
+    return {entry.get("text") for entry in load_json("journal.json")}
+
+
+def run_level(app_test_cls, level, flows, iterations, timeout):
+    out = {"latencies": {}, "errors": [], "harness_errors": [], "journal_tags": []}
+    threads = [
+        threading.Thread(
+            target=_session,
+            args=(app_test_cls, i, level, flows, iterations, timeout, out),
+        )
+        for i in range(level)
+    ]
+
+    with _Sampler() as sampler:
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+    saved = _journal_texts()
+    all_latencies = [v for values in out["latencies"].values() for v in values]
+    return {
+        "sessions": level,
+        "elapsed_s": round(elapsed, 3),
+        "flows_ok": len(all_latencies),
+        "errors": out["errors"],
+        "harness_errors": out["harness_errors"],
+        "throughput_per_s": round(len(all_latencies) / elapsed, 3) if elapsed else 0.0,
+        "latency_s": {
+            name: {
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "p99": round(percentile(values, 99), 3),
+            }
+            for name, values in [("all", all_latencies)] + sorted(out["latencies"].items())
+        },
+        "max_threads": sampler.max_threads,
+        "max_rss_mb": round(sampler.max_rss_mb, 1),
+        "journal_writes": len(out["journal_tags"]),
+        "journal_lost": len([t for t in out["journal_tags"] if t not in saved]),
+    }
+
+
+def print_report(result):
+    print(
+        f"\n== {result['sessions']} sessions: {result['flows_ok']} flows in "
+        f"{result['elapsed_s']}s ({result['throughput_per_s']}/s), "
+        f"{len(result['errors'])} errors, {len(result['harness_errors'])} harness errors, "
+        f"threads {result['max_threads']}, "
+        f"RSS {result['max_rss_mb']} MB"
+    )
+    print(f"   journal: {result['journal_writes']} saved, {result['journal_lost']} lost")
+    print(f"   {'flow':<12}{'p50 s':>10}{'p95 s':>10}{'p99 s':>10}")
+    for name, lat in result["latency_s"].items():
+        print(f"   {name:<12}{lat['p50']:>10.3f}{lat['p95']:>10.3f}{lat['p99']:>10.3f}")
+    for error in result["errors"][:5]:
+        print(f"   ! {error}")
+    for error in result["harness_errors"][:5]:
+        print(f"   ? {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--levels", default="1,2,4,8",
+                        help="comma-separated concurrent session counts to ramp through")
+    parser.add_argument("--iterations", type=int, default=2,
+                        help="times each session repeats the flow list")
+    parser.add_argument("--flows", default=",".join(FLOWS),
+                        help=f"comma-separated subset of: {', '.join(FLOWS)}")
+    parser.add_argument("--llm-latency", type=float, default=0.5,
+                        help="seconds the stub LLM waits before replying")
+    parser.add_argument("--timeout", type=float, default=120,
+                        help="per-rerun timeout (a breathing run blocks for ~48s)")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    flows = [f.strip() for f in args.flows.split(",") if f.strip()]
+    unknown = [f for f in flows if f not in FLOW_FUNCS]
+    if unknown:
+        parser.error(f"unknown flows: {', '.join(unknown)}")
+    levels = [int(n) for n in args.levels.split(",")]
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    # Point the OpenAI client at the stub before any app module creates it.
+    server = start_stub_llm(args.llm_latency)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+
+    # storage.py writes to ./data, so keep load-test entries out of the real journal.
+    sys.path.insert(0, APP_DIR)
+    os.chdir(tempfile.mkdtemp(prefix="mindmesh-loadtest-"))
+    print(f"Journal data in {os.getcwd()}")
+
+    from streamlit.testing.v1 import AppTest
+
+    results = []
+    try:
+        for level in levels:
+            result = run_level(AppTest, level, flows, args.iterations, args.timeout)
+            print_report(result)
+            results.append(result)
+    finally:
+        server.shutdown()
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# profile_report.py
+"""Summarize data/profile.jsonl: p50/p95 per section.
+
+Usage: python profile_report.py [--log data/profile.jsonl] [--page Journal]
+"""
+import argparse
+import json
+import os
+
+# Keep in sync with profiling.PROFILE_LOG (not imported: it pulls in streamlit).
+DEFAULT_LOG = os.path.join("data", "profile.jsonl")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def load_records(path, page=None):
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if page and record.get("page") != page:
+                continue
+            records.append(record)
+    return records
+
+
+def summarize(records):
+    timings = {"(total)": [r["total_ms"] for r in records]}
+    for r in records:
+        for name, stats in r.get("sections", {}).items():
+            timings.setdefault(name, []).append(stats["ms"])
+
+    rows = []
+    for name, values in timings.items():
+        if values:
+            rows.append((name, len(values), percentile(values, 50),
+                         percentile(values, 95), max(values)))
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-section rerun timings")
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    parser.add_argument("--page", help="only reruns of this sidebar page")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log):
+        print(f"No profile log at {args.log}. Run the app with MINDMESH_PROFILE=1.")
+        return
+
+    records = load_records(args.log, args.page)
+    print(f"{len(records)} reruns\n")
+    print(f"{'section':<28}{'n':>6}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+    for name, n, p50, p95, worst in summarize(records):
+        print(f"{name:<28}{n:>6}{p50:>12.2f}{p95:>12.2f}{worst:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# profiling.py
+import cProfile
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+import streamlit as st
+
+from storage import DATA_DIR
+
+# Enable with MINDMESH_PROFILE=1 (or ?profile=1 in the URL).
+# MINDMESH_PROFILE=cprofile also dumps a cProfile file per rerun; this is
+# env-only so visitors can't fill the disk through the query param.
+PROFILE_ENV = "MINDMESH_PROFILE"
+PROFILE_PARAM = "profile"
+PROFILE_LOG = os.path.join(DATA_DIR, "profile.jsonl")
+CPROFILE_DIR = os.path.join(DATA_DIR, "profiles")
+# Oldest dumps beyond this many are deleted.
+CPROFILE_MAX_DUMPS_ENV = "MINDMESH_PROFILE_MAX_DUMPS"
+DEFAULT_CPROFILE_MAX_DUMPS = 50
+
+_RUN_KEY = "_profile_run"
+
+
+# -------- MODE --------
+def _query_flag():
+    try:
+        return st.query_params.get(PROFILE_PARAM, "")
+    except Exception:
+        return ""
+
+
+def _is_off(value):
+    return value.strip().lower() in ("", "0", "false", "off", "no")
+
+
+def profiling_mode():
+    """Return "", "sections" or "cprofile" for the current rerun."""
+    env_value = os.getenv(PROFILE_ENV, "")
+    if not _is_off(env_value):
+        return "cprofile" if env_value.strip().lower() == "cprofile" else "sections"
+    # The query param can only turn on section timing.
+    return "" if _is_off(_query_flag()) else "sections"
+
+
+def _current_run():
+    try:
+        return st.session_state.get(_RUN_KEY)
+    except Exception:
+        return None
+
+
+# -------- RERUN LIFECYCLE --------
+def start_rerun():
+    """Begin timing a rerun. Call once near the top of app.py."""
+    previous = _current_run()
+    if previous and previous.get("profiler"):
+        # The last rerun was interrupted before finish_rerun() ran.
+        previous["profiler"].disable()
+
+    mode = profiling_mode()
+    if not mode:
+        st.session_state.pop(_RUN_KEY, None)
+        return
+
+    run = {
+        "id": uuid.uuid4().hex,
+        "started": datetime.now().isoformat(timespec="milliseconds"),
+        "mode": mode,
+        "sections": {},
+        "t0": time.perf_counter(),
+        "profiler": None,
+    }
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            run["profiler"] = profiler
+        except ValueError:
+            # Another profiler is already active on this thread.
+            pass
+    st.session_state[_RUN_KEY] = run
+
+
+def finish_rerun(page=""):
+    """Close the current rerun and append its record to PROFILE_LOG."""
+    run = _current_run()
+    if not run:
+        return
+    st.session_state.pop(_RUN_KEY, None)
+
+    total_ms = (time.perf_counter() - run["t0"]) * 1000
+    record = {
+        "id": run["id"],
+        "started": run["started"],
+        "page": page,
+        "total_ms": round(total_ms, 3),
+        "sections": {
+            name: {"ms": round(s["ms"], 3), "calls": s["calls"]}
+            for name, s in run["sections"].items()
+        },
+    }
+
+    profiler = run.get("profiler")
+    if profiler:
+        profiler.disable()
+        os.makedirs(CPROFILE_DIR, exist_ok=True)
+        prof_path = os.path.join(CPROFILE_DIR, f"{run['id']}.prof")
+        profiler.dump_stats(prof_path)
+        # Open with snakeviz / flameprof for a flame graph.
+        record["cprofile"] = prof_path
+        _prune_dumps()
+
+    with open(PROFILE_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _prune_dumps():
+    max_dumps = int(os.getenv(CPROFILE_MAX_DUMPS_ENV, DEFAULT_CPROFILE_MAX_DUMPS))
+    paths = [
+        os.path.join(CPROFILE_DIR, name)
+        for name in os.listdir(CPROFILE_DIR)
+        if name.endswith(".prof")
+    ]
+    paths.sort(key=os.path.getmtime)
+    for path in paths[:max(0, len(paths) - max_dumps)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# -------- SECTIONS --------
+@contextmanager
+def section(name):
+    """Time a named block of the current rerun. No-op when profiling is off."""
+    run = _current_run()
+    if not run:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        stats = run["sections"].setdefault(name, {"ms": 0.0, "calls": 0})
+        stats["ms"] += elapsed
+        stats["calls"] += 1
+
+
+def profiled(name):
+    """Decorator form of section()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
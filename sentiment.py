@@ -1,9 +1,14 @@
 from textblob import TextBlob
 
-def sentiment_score(text: str):
-    polarity = TextBlob(text).sentiment.polarity
+def polarity_score(text: str):
+    return TextBlob(text).sentiment.polarity
+
+def sentiment_label(polarity: float):
     if polarity > 0.2:
         return "positive"
     elif polarity < -0.2:
         return "negative"
     return "neutral"
+
+def sentiment_score(text: str):
+    return sentiment_label(polarity_score(text))
@@ -0,0 +1,147 @@
+# speculation.py
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agents import assessment_agent
+
+# Enable with MINDMESH_SPECULATE=1. MINDMESH_SPECULATE_MAX caps the number of
+# speculative assessment calls a single session may start, and the inputs must
+# stay unchanged for MINDMESH_SPECULATE_DELAY seconds before one is started.
+SPECULATE_ENV = "MINDMESH_SPECULATE"
+SPECULATE_MAX_ENV = "MINDMESH_SPECULATE_MAX"
+SPECULATE_DELAY_ENV = "MINDMESH_SPECULATE_DELAY"
+DEFAULT_MAX_CALLS = 5
+DEFAULT_DELAY_SECONDS = 3.0
+
+# Shared by every session so speculative calls can't pile up threads.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="speculate")
+
+
+def speculation_enabled():
+    return os.getenv(SPECULATE_ENV, "").strip().lower() in ("1", "true", "on", "yes")
+
+
+def inputs_key(inputs):
+    """Stable hash of the assessment_agent arguments."""
+    payload = json.dumps([str(value) for value in inputs], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _timed_assessment(inputs):
+    start = time.perf_counter()
+    text = assessment_agent(*inputs)
+    return text, time.perf_counter() - start
+
+
+class AssessmentSpeculator:
+    """Runs assessment_agent ahead of "Generate Plan" for one session.
+
+    `inputs` is always the full assessment_agent argument tuple
+    (background, concerns, goals, coping, sleep, activity, support).
+    """
+
+    def __init__(self, max_calls=None, delay=None):
+        if max_calls is None:
+            max_calls = int(os.getenv(SPECULATE_MAX_ENV, DEFAULT_MAX_CALLS))
+        if delay is None:
+            delay = float(os.getenv(SPECULATE_DELAY_ENV, DEFAULT_DELAY_SECONDS))
+        self.max_calls = max_calls
+        self.delay = delay
+        self.key = None
+        self.future = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.stale = 0
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def update(self, inputs):
+        """Schedule a speculation on `inputs` if they are complete and have changed.
+
+        Call every rerun. The call only starts once the inputs have stayed the
+        same for `delay` seconds, so filling in the form field by field doesn't
+        launch (and waste) one call per field.
+        """
+        background, concerns, goals = inputs[:3]
+        if not (background.strip() and concerns.strip() and goals.strip()):
+            return
+        key = inputs_key(inputs)
+        with self._lock:
+            if key == self.key:
+                return
+            self._discard()
+            self.key = key
+            if self.launched >= self.max_calls:
+                return
+            self._timer = threading.Timer(self.delay, self._launch, args=(key, tuple(inputs)))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _launch(self, key, inputs):
+        with self._lock:
+            if key != self.key or self.future is not None or self.launched >= self.max_calls:
+                return
+            self._timer = None
+            self.future = _executor.submit(_timed_assessment, inputs)
+            self.launched += 1
+
+    def take(self, inputs):
+        """Return the speculated assessment for `inputs`, or None on a miss.
+
+        On a miss the caller runs the assessment itself, so these inputs are
+        remembered and not speculated on again until they change.
+        """
+        key = inputs_key(inputs)
+        with self._lock:
+            future = self.future if key == self.key else None
+            if self._timer is not None:
+                self._timer.cancel()
+            self.key, self.future, self._timer = key, None, None
+
+        # A call still queued behind other sessions would only add latency;
+        # cancel it and let the caller run the assessment inline.
+        if future is None or future.cancel():
+            self.misses += 1
+            return None
+
+        wait_start = time.perf_counter()
+        try:
+            text, duration = future.result()
+        except Exception:
+            text, duration = None, 0.0
+        waited = time.perf_counter() - wait_start
+
+        if not text or text.startswith("⚠️ OpenAI Error"):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved_seconds += max(0.0, duration - waited)
+        return text
+
+    def _discard(self):
+        # Caller holds self._lock.
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.future is not None:
+            # A call already in flight can't be interrupted; its result is dropped.
+            self.future.cancel()
+            self.stale += 1
+        self.key, self.future, self._timer = None, None, None
+
+    def metrics(self):
+        clicks = self.hits + self.misses
+        return {
+            "launched": self.launched,
+            "stale": self.stale,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / clicks if clicks else 0.0,
+            "saved_seconds": round(self.saved_seconds, 2),
+        }
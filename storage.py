@@ -17,3 +17,54 @@ def save_json(filename, data):
     filepath = os.path.join(DATA_DIR, filename)
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def iter_json(filename, chunk_size=1 << 16):
+    """Yield the items of a JSON array file one at a time, reading it in chunks.
+
+    A missing or empty file yields nothing; malformed JSON raises ValueError.
+    """
+    filepath = os.path.join(DATA_DIR, filename)
+    if not os.path.exists(filepath):
+        return
+    decoder = json.JSONDecoder()
+    with open(filepath, "r", encoding="utf-8") as f:
+        buf, eof, in_array = "", False, False
+        while True:
+            buf = buf.lstrip()
+            if in_array and buf[:1] == ",":
+                buf = buf[1:].lstrip()
+            if buf:
+                if not in_array:
+                    if buf[0] != "[":
+                        raise ValueError(f"{filepath} is not a JSON array")
+                    buf, in_array = buf[1:], True
+                    continue
+                if buf[0] == "]":
+                    return
+                try:
+                    item, end = decoder.raw_decode(buf)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = None
+                if end is not None and (eof or not _maybe_truncated(item, buf, end)):
+                    yield item
+                    buf = buf[end:]
+                    continue
+            if eof:
+                if in_array:
+                    raise ValueError(f"{filepath} ends before the closing ]")
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf += chunk
+
+
+def _maybe_truncated(item, buf, end):
+    """True if the value decoded from buf[:end] may continue in the next chunk."""
+    if end == len(buf):
+        return True
+    # "15." or "1.5e" decode as 15 / 1.5 with the rest of the number unread.
+    is_number = isinstance(item, (int, float)) and not isinstance(item, bool)
+    return is_number and buf[end] in "0123456789.eE+-"
@@ -1,7 +1,8 @@
 import streamlit as st
 from datetime import datetime
 from storage import load_json, save_json
-from sentiment import sentiment_score
+from sentiment import polarity_score, sentiment_label
+from profiling import section, profiled
 import time
 
 # -------- IMPORT YOUR OPENAI AGENT HELPERS --------
@@ -18,6 +19,7 @@ client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 # -------- OPENAI HELPER --------
 
+@profiled("llm")
 def call_openai(prompt: str):
     """Send a prompt to OpenAI and return clean text output."""
     try:
@@ -83,37 +85,42 @@ def ai_supportive_message(text):
 
 def journal_ui():
     st.markdown("## 🧾 Safe-Space Journal")
-    entries = load_json("journal.json")
+    with section("journal.load"):
+        entries = load_json("journal.json")
     text = st.text_area("Write freely...", height=150)
 
     if st.button("Save Entry"):
         if text.strip():
             reflection = ai_reflection(text)
+            polarity = polarity_score(text)
 
             entry = {
                 "text": text,
-                "sentiment": sentiment_score(text),
+                "sentiment": sentiment_label(polarity),
+                "polarity": polarity,
                 "ai_reflection": reflection,
                 "timestamp": datetime.now().strftime("%d %b %Y, %I:%M %p")
             }
             entries.append(entry)
-            save_json("journal.json", entries)
+            with section("journal.save"):
+                save_json("journal.json", entries)
             st.success("Saved.")
             st.info(reflection)
 
     st.markdown("### Past Entries")
-    for e in reversed(entries[-20:]):
-        st.markdown(
-            f"""
-            <div class="glass" style="margin-bottom:10px">
-                <strong>{e['timestamp']}</strong><br>
-                {e['text']}<br>
-                <small>Sentiment: {e['sentiment']}</small><br>
-                <em style="opacity:0.7;">AI Reflection: {e.get('ai_reflection', '')}</em>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    with section("journal.render"):
+        for e in reversed(entries[-20:]):
+            st.markdown(
+                f"""
+                <div class="glass" style="margin-bottom:10px">
+                    <strong>{e['timestamp']}</strong><br>
+                    {e['text']}<br>
+                    <small>Sentiment: {e['sentiment']}</small><br>
+                    <em style="opacity:0.7;">AI Reflection: {e.get('ai_reflection', '')}</em>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
 
 # -------------- AI RELAXATION SECTION --------------
 
@@ -155,37 +162,38 @@ def relaxation_ui():
         st.markdown('<div class="breathing-circle"></div>', unsafe_allow_html=True)
 
         if st.button("Start Breathing Exercise"):
-            placeholder = st.empty()
+            with section("relaxation.breathing"):
+                placeholder = st.empty()
 
-            for cycle in range(3):
-                placeholder.markdown(
-                    f"<h3 class='breathing-text'>Breathe in… ({inhale}s)</h3>",
-                    unsafe_allow_html=True
-                )
-                time.sleep(inhale)
-
-                if hold > 0:
+                for cycle in range(3):
                     placeholder.markdown(
-                        f"<h3 class='breathing-text'>Hold… ({hold}s)</h3>",
+                        f"<h3 class='breathing-text'>Breathe in… ({inhale}s)</h3>",
                         unsafe_allow_html=True
                     )
-                    time.sleep(hold)
+                    time.sleep(inhale)
 
-                placeholder.markdown(
-                    f"<h3 class='breathing-text'>Breathe out… ({exhale}s)</h3>",
-                    unsafe_allow_html=True
-                )
-                time.sleep(exhale)
+                    if hold > 0:
+                        placeholder.markdown(
+                            f"<h3 class='breathing-text'>Hold… ({hold}s)</h3>",
+                            unsafe_allow_html=True
+                        )
+                        time.sleep(hold)
 
-                if hold2 > 0:
                     placeholder.markdown(
-                        f"<h3 class='breathing-text'>Hold… ({hold2}s)</h3>",
+                        f"<h3 class='breathing-text'>Breathe out… ({exhale}s)</h3>",
                         unsafe_allow_html=True
                     )
-                    time.sleep(hold2)
+                    time.sleep(exhale)
+
+                    if hold2 > 0:
+                        placeholder.markdown(
+                            f"<h3 class='breathing-text'>Hold… ({hold2}s)</h3>",
+                            unsafe_allow_html=True
+                        )
+                        time.sleep(hold2)
 
-            placeholder.markdown("<h3 class='breathing-text'>Complete ✨</h3>", unsafe_allow_html=True)
-            st.success("Your breathing exercise is complete. Notice how your body feels now.")
+                placeholder.markdown("<h3 class='breathing-text'>Complete ✨</h3>", unsafe_allow_html=True)
+                st.success("Your breathing exercise is complete. Notice how your body feels now.")
 
     # ----- Mind Relaxation Tab -----
     with tab2: